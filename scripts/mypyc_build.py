@@ -0,0 +1,38 @@
+"""
+Optional ahead-of-time compilation of the hot JSON inference module.
+
+Compiles ``aste.utils.json_schema`` to a native extension with mypyc and
+drops the resulting shared library next to the source module, where the
+import system prefers it over the ``.py`` file. The pure-Python module
+stays in place as the fallback for environments without the build.
+
+Requires ``mypy`` (which ships mypyc) and a C compiler:
+
+    uv run python scripts/mypyc_build.py
+"""
+
+import sys
+
+
+def main() -> None:
+    """Build the native extension in place."""
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        sys.exit("mypyc is not available; install mypy to build the extension.")
+
+    from setuptools import setup
+
+    setup(
+        name="aste-native",
+        # Only json_schema.py is compiled; silence mypy for the sibling
+        # modules it merely follows through the package __init__ chain.
+        ext_modules=mypycify(
+            ["--follow-imports=silent", "src/aste/utils/json_schema.py"]
+        ),
+        script_args=["build_ext", "--inplace"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """CLI interface for generating data structure code."""
 
 import argparse
+import asyncio
 import sys
 from typing import Any
 
@@ -9,34 +10,27 @@ from rich.console import Console
 from aste.datastructures.factory import DataStructureFactory
 from aste.utils.json_schema import infer_fields_from_json
 from aste.utils.json_schema import load_json_from_file
-from aste.utils.json_schema import load_json_from_url
+from aste.utils.json_schema import load_json_from_urls
 
 
 console = Console()
 
+_BUILDER_TYPES = ("typed_dict", "dataclass", "pydantic", "namedtuple", "attrs")
 
-def main() -> None:
-    """
-    Generate code for various Python data structures using AST.
 
-    Examples
-    --------
-    >>> # From JSON file
-    >>> # python -m aste.cli.main --json user.json --type dataclass
-    >>> # From URL
-    >>> # python -m aste.cli.main --url https://api.example.com/user --type pydantic
-    >>> # Default example
-    >>> # python -m aste.cli.main --type dataclass
-    """
+def _build_parser() -> argparse.ArgumentParser:
+    """Construct the CLI argument parser."""
     parser = argparse.ArgumentParser(
         description="Generate Python data structures from JSON using AST."
     )
     parser.add_argument(
         "-t",
         "--type",
-        choices=["typed_dict", "dataclass", "pydantic", "namedtuple", "attrs"],
         default="typed_dict",
-        help="Type of data structure to generate",
+        help=(
+            "Comma-separated data structure types to generate "
+            f"({', '.join(_BUILDER_TYPES)}), or 'all'"
+        ),
     )
     parser.add_argument(
         "-n",
@@ -52,34 +46,95 @@ def main() -> None:
     parser.add_argument(
         "-u",
         "--url",
-        help="URL to fetch JSON from",
+        action="append",
+        help="URL to fetch JSON from (repeatable; fields are merged)",
     )
     parser.add_argument(
         "-o",
         "--output",
         help="Output file path (default: <classname>_<type>.py)",
     )
-    args = parser.parse_args()
+    return parser
+
 
-    json_data: dict[str, Any] | None = None
+# Built once at import time so repeated main() calls (tests, scripting)
+# skip the argparse setup cost.
+_PARSER = _build_parser()
+
+
+def _load_json_data(args: argparse.Namespace) -> dict[str, Any] | None:
+    """Load the input document from the file or URL arguments, if any."""
     if args.json:
         try:
             console.print(f"[cyan]Loading JSON from file: {args.json}[/cyan]")
-            json_data = load_json_from_file(args.json)
+            return load_json_from_file(args.json)
         except FileNotFoundError:
             console.print(f"[red]Error: File not found: {args.json}[/red]")
             sys.exit(1)
         except Exception as e:
             console.print(f"[red]Error loading JSON file: {e}[/red]")
             sys.exit(1)
-    elif args.url:
+    if args.url:
         try:
-            console.print(f"[cyan]Fetching JSON from URL: {args.url}[/cyan]")
-            json_data = load_json_from_url(args.url)
+            console.print(f"[cyan]Fetching JSON from {len(args.url)} URL(s)[/cyan]")
+            documents = asyncio.run(load_json_from_urls(args.url))
+            json_data: dict[str, Any] = {}
+            for document in documents:
+                json_data.update(document)
         except Exception as e:
             console.print(f"[red]Error fetching JSON from URL: {e}[/red]")
             sys.exit(1)
+        return json_data
+    return None
+
+
+def _resolve_builder_types(type_arg: str) -> list[str]:
+    """Expand and validate the comma-separated --type argument."""
+    if type_arg == "all":
+        return list(_BUILDER_TYPES)
+    builder_types = [t.strip() for t in type_arg.split(",")]
+    for builder_type in builder_types:
+        if builder_type not in _BUILDER_TYPES:
+            console.print(f"[red]Error: Unknown builder type: {builder_type}[/red]")
+            sys.exit(1)
+    return builder_types
+
+
+def _write_payloads(
+    payloads: list[tuple[str, bytes]], output: str | None, class_name: str
+) -> None:
+    """Write generated code to one fused module or per-type files."""
+    if output and len(payloads) > 1:
+        # One fused module holding every requested variant.
+        with open(output, "wb") as f:
+            f.write(b"\n".join(payload for _, payload in payloads))
+        console.print(f"\n[green]✓ Code saved to {output}[/green]")
+        return
+    for builder_type, payload in payloads:
+        output_filename = (
+            output if output else f"{class_name.lower()}_{builder_type}.py"
+        )
+        with open(output_filename, "wb") as f:
+            f.write(payload)
+        console.print(f"\n[green]✓ Code saved to {output_filename}[/green]")
+
 
+def main() -> None:
+    """
+    Generate code for various Python data structures using AST.
+
+    Examples
+    --------
+    >>> # From JSON file
+    >>> # python -m aste.cli.main --json user.json --type dataclass
+    >>> # From URL
+    >>> # python -m aste.cli.main --url https://api.example.com/user --type pydantic
+    >>> # Default example
+    >>> # python -m aste.cli.main --type dataclass
+    """
+    args = _PARSER.parse_args()
+
+    json_data = _load_json_data(args)
     if json_data:
         fields = infer_fields_from_json(json_data)
         console.print(f"[green]Inferred {len(fields)} fields from JSON[/green]")
@@ -90,20 +145,18 @@ def main() -> None:
 
     class_name = args.name
 
-    builder = DataStructureFactory.get_builder(args.type)
-    generated_code = builder.build(class_name, fields)
-
-    console.print("\n[bold cyan]Generated Code:[/bold cyan]")
-    console.print(generated_code)
-
-    output_filename = (
-        args.output if args.output else f"{class_name.lower()}_{args.type}.py"
-    )
+    # Inference ran once above; every requested builder reuses the same
+    # fields dict instead of re-reading and re-inferring per type.
+    payloads: list[tuple[str, bytes]] = []
+    for builder_type in _resolve_builder_types(args.type):
+        builder = DataStructureFactory.get_builder(builder_type)
+        payload = builder.build_bytes(class_name, fields)
+        payloads.append((builder_type, payload))
 
-    with open(output_filename, "w", encoding="utf-8") as f:
-        f.write(generated_code)
+        console.print(f"\n[bold cyan]Generated Code ({builder_type}):[/bold cyan]")
+        console.print(payload.decode("utf-8"))
 
-    console.print(f"\n[green]✓ Code saved to {output_filename}[/green]")
+    _write_payloads(payloads, args.output, class_name)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,10 @@
 from abc import ABC
 from abc import abstractmethod
 import ast
+from collections.abc import Iterator
+from functools import lru_cache
+from types import CodeType
+from typing import ClassVar
 
 
 class DataStructureBuilder(ABC):
@@ -12,6 +16,12 @@ class DataStructureBuilder(ABC):
     Implementations should generate code for different data structures
     (e.g., TypedDict, dataclass, Pydantic model).
 
+    Concrete builders that declare the class-level template fragments
+    (``_IMPORTS_SRC``, ``_BASES_SRC``, ``_DECORATORS_SRC``) get a fast
+    string-assembly ``build``; builders without templates fall back to
+    the AST-based ``build_ast``, which is also available to any caller
+    that needs node-level manipulation.
+
     Examples
     --------
     >>> class CustomBuilder(DataStructureBuilder):
@@ -27,6 +37,21 @@ class DataStructureBuilder(ABC):
     >>> code = builder.build("MyClass", {"field": "str"})
     """
 
+    #: Import block emitted before the class, e.g.
+    #: ``"from typing import TypedDict"``. ``None`` disables the template
+    #: fast path and routes ``build`` through ``build_ast``.
+    _IMPORTS_SRC: ClassVar[str | None] = None
+
+    #: Comma-separated base list, e.g. ``"TypedDict"``; empty for none.
+    _BASES_SRC: ClassVar[str] = ""
+
+    #: Decorator names (without ``@``), e.g. ``("dataclass",)``.
+    _DECORATORS_SRC: ClassVar[tuple[str, ...]] = ()
+
+    #: Pre-encoded invariant prefix (imports plus the blank separator
+    #: line); lets ``build_bytes`` skip re-encoding the header per call.
+    _PREFIX_BYTES: ClassVar[bytes | None] = None
+
     @abstractmethod
     def _build_imports(self, class_name: str, fields: dict[str, str]) -> list[ast.stmt]:
         """Return list of AST import nodes."""
@@ -52,7 +77,12 @@ class DataStructureBuilder(ABC):
 
     def build(self, class_name: str, fields: dict[str, str]) -> str:
         """
-        Assemble import nodes, class definition, and module.
+        Generate source code for the class from string templates.
+
+        The output is identical to ``build_ast`` but skips AST node
+        construction and the ``ast.unparse`` traversal entirely: the
+        module layout is fixed, so the source can be assembled directly
+        from the class-level template fragments.
 
         Parameters
         ----------
@@ -73,6 +103,170 @@ class DataStructureBuilder(ABC):
         >>> "class User(TypedDict):" in code
         True
         """
+        if self._IMPORTS_SRC is None:
+            return self.build_ast(class_name, fields)
+        # fields must become hashable for the cache; the tuple keeps
+        # insertion order so the rendered field order is unchanged.
+        return self._build_cached(class_name, tuple(fields.items()))
+
+    @lru_cache(maxsize=512)  # noqa: B019 - builders are stateless singletons
+    def _build_cached(
+        self, class_name: str, field_items: tuple[tuple[str, str], ...]
+    ) -> str:
+        """Render and memoize the source for one (class_name, fields) pair."""
+        return "\n".join(self._render_lines(class_name, field_items))
+
+    def build_iter(self, class_name: str, fields: dict[str, str]) -> Iterator[str]:
+        """
+        Yield the generated source as newline-terminated chunks.
+
+        Lets callers stream the code straight to a file (e.g. via
+        ``writelines``) without first materializing the full module
+        string in memory.
+
+        Parameters
+        ----------
+        class_name : str
+            Name of the class to generate
+        fields : dict[str, str]
+            Mapping of field names to type names
+
+        Yields
+        ------
+        str
+            Source chunks, each terminated by a newline
+
+        Examples
+        --------
+        >>> builder = TypedDictBuilder()
+        >>> chunks = list(builder.build_iter("User", {"id": "int"}))
+        >>> "".join(chunks).rstrip() == builder.build("User", {"id": "int"})
+        True
+        """
+        if self._IMPORTS_SRC is None:
+            yield self.build_ast(class_name, fields) + "\n"
+            return
+        for line in self._render_lines(class_name, tuple(fields.items())):
+            yield f"{line}\n"
+
+    def build_code(self, class_name: str, fields: dict[str, str]) -> CodeType:
+        """
+        Compile the generated source to a cached code object.
+
+        Callers that exec/import the generated class repeatedly (e.g. a
+        service regenerating the same handful of schemas) skip both the
+        rendering and the parse step on cache hits.
+
+        Parameters
+        ----------
+        class_name : str
+            Name of the class to generate
+        fields : dict[str, str]
+            Mapping of field names to type names
+
+        Returns
+        -------
+        CodeType
+            Compiled code object ready for ``exec``
+
+        Examples
+        --------
+        >>> builder = TypedDictBuilder()
+        >>> namespace = {}
+        >>> exec(builder.build_code("User", {"id": "int"}), namespace)
+        >>> namespace["User"].__annotations__["id"]
+        'int'
+        """
+        return self._compile_cached(class_name, tuple(fields.items()))
+
+    @lru_cache(maxsize=128)  # noqa: B019 - builders are stateless singletons
+    def _compile_cached(
+        self, class_name: str, field_items: tuple[tuple[str, str], ...]
+    ) -> CodeType:
+        """Compile and memoize one (class_name, fields) combination."""
+        source = self.build(class_name, dict(field_items))
+        return compile(source, f"<aste:{class_name}>", "exec")
+
+    def build_bytes(self, class_name: str, fields: dict[str, str]) -> bytes:
+        """
+        Generate the source as UTF-8 bytes ready for a binary write.
+
+        The invariant header is taken from the pre-encoded
+        ``_PREFIX_BYTES`` constant, so only the per-class remainder goes
+        through str-to-bytes encoding.
+
+        Parameters
+        ----------
+        class_name : str
+            Name of the class to generate
+        fields : dict[str, str]
+            Mapping of field names to type names
+
+        Returns
+        -------
+        bytes
+            Generated Python code, newline-terminated
+
+        Examples
+        --------
+        >>> builder = TypedDictBuilder()
+        >>> payload = builder.build_bytes("User", {"id": "int"})
+        >>> payload.decode().rstrip() == builder.build("User", {"id": "int"})
+        True
+        """
+        if self._PREFIX_BYTES is None:
+            return "".join(self.build_iter(class_name, fields)).encode("utf-8")
+        lines = self._render_lines(class_name, tuple(fields.items()))
+        next(lines)  # imports: already encoded in _PREFIX_BYTES
+        next(lines)  # blank separator line, likewise
+        return self._PREFIX_BYTES + "\n".join(lines).encode("utf-8") + b"\n"
+
+    def _render_lines(
+        self, class_name: str, field_items: tuple[tuple[str, str], ...]
+    ) -> Iterator[str]:
+        """
+        Yield the source lines for the known module layout.
+
+        This is the single specialized rendering path: imports, optional
+        decorators, one class statement, one annotated field per line.
+        Skipping the generic ``ast.unparse`` traversal for this fixed
+        shape is what makes the template ``build`` cheap.
+        """
+        yield self._IMPORTS_SRC or ""
+        yield ""
+        for decorator in self._DECORATORS_SRC:
+            yield f"@{decorator}"
+        bases = f"({self._BASES_SRC})" if self._BASES_SRC else ""
+        yield f"class {class_name}{bases}:"
+        if field_items:
+            for name, typ in field_items:
+                yield f"    {name}: {typ}"
+        else:
+            yield "    pass"
+
+    def build_ast(self, class_name: str, fields: dict[str, str]) -> str:
+        """
+        Assemble import nodes, class definition, and module.
+
+        Parameters
+        ----------
+        class_name : str
+            Name of the class to generate
+        fields : dict[str, str]
+            Mapping of field names to type names
+
+        Returns
+        -------
+        str
+            Generated Python code as string
+
+        Examples
+        --------
+        >>> builder = TypedDictBuilder()
+        >>> code = builder.build_ast("User", {"id": "int", "name": "str"})
+        >>> "class User(TypedDict):" in code
+        True
+        """
         import_nodes = self._build_imports(class_name, fields)
         body_nodes = self._build_body_nodes(class_name, fields)
         bases = self._build_bases(class_name, fields)
@@ -1,10 +1,45 @@
 """Concrete implementations of data structure builders."""
 
 import ast
+from typing import ClassVar
 
 from aste.datastructures.base import DataStructureBuilder
 
 
+# Context singletons shared across nodes: ast.unparse only dispatches on
+# their type, so one instance each is enough for the whole module.
+_LOAD = ast.Load()
+_STORE = ast.Store()
+
+
+def _ann_assigns(fields: dict[str, str]) -> list[ast.stmt]:
+    """
+    Build the annotated-assignment body shared by every builder.
+
+    Parameters
+    ----------
+    fields : dict[str, str]
+        Mapping of field names to type names
+
+    Returns
+    -------
+    list[ast.stmt]
+        One ``ast.AnnAssign`` per field, or ``[ast.Pass()]`` when empty
+    """
+    # One annotation node per distinct type: ast.unparse only reads the
+    # nodes, so fifty "str" fields can share a single ast.Name.
+    type_nodes = {typ: ast.Name(id=typ, ctx=_LOAD) for typ in set(fields.values())}
+    nodes: list[ast.stmt] = [
+        ast.AnnAssign(
+            target=ast.Name(id=name, ctx=_STORE),
+            annotation=type_nodes[typ],
+            simple=1,
+        )
+        for name, typ in fields.items()
+    ]
+    return nodes or [ast.Pass()]
+
+
 class TypedDictBuilder(DataStructureBuilder):
     """
     Builder for Python TypedDict structures using AST.
@@ -19,31 +54,25 @@ class TypedDictBuilder(DataStructureBuilder):
     True
     """
 
+    _IMPORTS_SRC = "from typing import TypedDict"
+    _BASES_SRC = "TypedDict"
+    _PREFIX_BYTES = b"from typing import TypedDict\n\n"
+
+    _IMPORT_NODES: ClassVar[list[ast.stmt]] = [
+        ast.ImportFrom(module="typing", names=[ast.alias(name="TypedDict")], level=0)
+    ]
+    _BASE_NODES: ClassVar[list[ast.expr]] = [ast.Name(id="TypedDict", ctx=_LOAD)]
+
     def _build_imports(self, class_name: str, fields: dict[str, str]) -> list[ast.stmt]:
-        return [
-            ast.ImportFrom(
-                module="typing", names=[ast.alias(name="TypedDict")], level=0
-            )
-        ]
+        return self._IMPORT_NODES
 
     def _build_body_nodes(
         self, class_name: str, fields: dict[str, str]
     ) -> list[ast.stmt]:
-        nodes: list[ast.stmt] = []
-        for name, typ in fields.items():
-            nodes.append(
-                ast.AnnAssign(
-                    target=ast.Name(id=name, ctx=ast.Store()),
-                    annotation=ast.Name(id=typ, ctx=ast.Load()),
-                    simple=1,
-                )
-            )
-        if not nodes:
-            nodes.append(ast.Pass())
-        return nodes
+        return _ann_assigns(fields)
 
     def _build_bases(self, class_name: str, fields: dict[str, str]) -> list[ast.expr]:
-        return [ast.Name(id="TypedDict", ctx=ast.Load())]
+        return self._BASE_NODES
 
 
 class DataclassBuilder(DataStructureBuilder):
@@ -60,30 +89,24 @@ class DataclassBuilder(DataStructureBuilder):
     True
     """
 
+    _IMPORTS_SRC = "from dataclasses import dataclass"
+    _DECORATORS_SRC = ("dataclass",)
+    _PREFIX_BYTES = b"from dataclasses import dataclass\n\n"
+
+    _IMPORT_NODES: ClassVar[list[ast.stmt]] = [
+        ast.ImportFrom(
+            module="dataclasses", names=[ast.alias(name="dataclass")], level=0
+        )
+    ]
+    _DECORATOR_NODES: ClassVar[list[ast.expr]] = [ast.Name(id="dataclass", ctx=_LOAD)]
+
     def _build_imports(self, class_name: str, fields: dict[str, str]) -> list[ast.stmt]:
-        return [
-            ast.ImportFrom(
-                module="dataclasses",
-                names=[ast.alias(name="dataclass")],
-                level=0,
-            )
-        ]
+        return self._IMPORT_NODES
 
     def _build_body_nodes(
         self, class_name: str, fields: dict[str, str]
     ) -> list[ast.stmt]:
-        nodes: list[ast.stmt] = []
-        for name, typ in fields.items():
-            nodes.append(
-                ast.AnnAssign(
-                    target=ast.Name(id=name, ctx=ast.Store()),
-                    annotation=ast.Name(id=typ, ctx=ast.Load()),
-                    simple=1,
-                )
-            )
-        if not nodes:
-            nodes.append(ast.Pass())
-        return nodes
+        return _ann_assigns(fields)
 
     def _build_bases(self, class_name: str, fields: dict[str, str]) -> list[ast.expr]:
         return []
@@ -91,7 +114,7 @@ class DataclassBuilder(DataStructureBuilder):
     def _build_decorators(
         self, class_name: str, fields: dict[str, str]
     ) -> list[ast.expr]:
-        return [ast.Name(id="dataclass", ctx=ast.Load())]
+        return self._DECORATOR_NODES
 
 
 class PydanticBuilder(DataStructureBuilder):
@@ -108,31 +131,25 @@ class PydanticBuilder(DataStructureBuilder):
     True
     """
 
+    _IMPORTS_SRC = "from pydantic import BaseModel"
+    _BASES_SRC = "BaseModel"
+    _PREFIX_BYTES = b"from pydantic import BaseModel\n\n"
+
+    _IMPORT_NODES: ClassVar[list[ast.stmt]] = [
+        ast.ImportFrom(module="pydantic", names=[ast.alias(name="BaseModel")], level=0)
+    ]
+    _BASE_NODES: ClassVar[list[ast.expr]] = [ast.Name(id="BaseModel", ctx=_LOAD)]
+
     def _build_imports(self, class_name: str, fields: dict[str, str]) -> list[ast.stmt]:
-        return [
-            ast.ImportFrom(
-                module="pydantic", names=[ast.alias(name="BaseModel")], level=0
-            )
-        ]
+        return self._IMPORT_NODES
 
     def _build_body_nodes(
         self, class_name: str, fields: dict[str, str]
     ) -> list[ast.stmt]:
-        nodes: list[ast.stmt] = []
-        for name, typ in fields.items():
-            nodes.append(
-                ast.AnnAssign(
-                    target=ast.Name(id=name, ctx=ast.Store()),
-                    annotation=ast.Name(id=typ, ctx=ast.Load()),
-                    simple=1,
-                )
-            )
-        if not nodes:
-            nodes.append(ast.Pass())
-        return nodes
+        return _ann_assigns(fields)
 
     def _build_bases(self, class_name: str, fields: dict[str, str]) -> list[ast.expr]:
-        return [ast.Name(id="BaseModel", ctx=ast.Load())]
+        return self._BASE_NODES
 
 
 class NamedTupleBuilder(DataStructureBuilder):
@@ -149,31 +166,25 @@ class NamedTupleBuilder(DataStructureBuilder):
     True
     """
 
+    _IMPORTS_SRC = "from typing import NamedTuple"
+    _BASES_SRC = "NamedTuple"
+    _PREFIX_BYTES = b"from typing import NamedTuple\n\n"
+
+    _IMPORT_NODES: ClassVar[list[ast.stmt]] = [
+        ast.ImportFrom(module="typing", names=[ast.alias(name="NamedTuple")], level=0)
+    ]
+    _BASE_NODES: ClassVar[list[ast.expr]] = [ast.Name(id="NamedTuple", ctx=_LOAD)]
+
     def _build_imports(self, class_name: str, fields: dict[str, str]) -> list[ast.stmt]:
-        return [
-            ast.ImportFrom(
-                module="typing", names=[ast.alias(name="NamedTuple")], level=0
-            )
-        ]
+        return self._IMPORT_NODES
 
     def _build_body_nodes(
         self, class_name: str, fields: dict[str, str]
     ) -> list[ast.stmt]:
-        nodes: list[ast.stmt] = []
-        for name, typ in fields.items():
-            nodes.append(
-                ast.AnnAssign(
-                    target=ast.Name(id=name, ctx=ast.Store()),
-                    annotation=ast.Name(id=typ, ctx=ast.Load()),
-                    simple=1,
-                )
-            )
-        if not nodes:
-            nodes.append(ast.Pass())
-        return nodes
+        return _ann_assigns(fields)
 
     def _build_bases(self, class_name: str, fields: dict[str, str]) -> list[ast.expr]:
-        return [ast.Name(id="NamedTuple", ctx=ast.Load())]
+        return self._BASE_NODES
 
 
 class AttrsBuilder(DataStructureBuilder):
@@ -190,26 +201,22 @@ class AttrsBuilder(DataStructureBuilder):
     True
     """
 
+    _IMPORTS_SRC = "from attr import define"
+    _DECORATORS_SRC = ("define",)
+    _PREFIX_BYTES = b"from attr import define\n\n"
+
+    _IMPORT_NODES: ClassVar[list[ast.stmt]] = [
+        ast.ImportFrom(module="attr", names=[ast.alias(name="define")], level=0)
+    ]
+    _DECORATOR_NODES: ClassVar[list[ast.expr]] = [ast.Name(id="define", ctx=_LOAD)]
+
     def _build_imports(self, class_name: str, fields: dict[str, str]) -> list[ast.stmt]:
-        return [
-            ast.ImportFrom(module="attr", names=[ast.alias(name="define")], level=0)
-        ]
+        return self._IMPORT_NODES
 
     def _build_body_nodes(
         self, class_name: str, fields: dict[str, str]
     ) -> list[ast.stmt]:
-        nodes: list[ast.stmt] = []
-        for name, typ in fields.items():
-            nodes.append(
-                ast.AnnAssign(
-                    target=ast.Name(id=name, ctx=ast.Store()),
-                    annotation=ast.Name(id=typ, ctx=ast.Load()),
-                    simple=1,
-                )
-            )
-        if not nodes:
-            nodes.append(ast.Pass())
-        return nodes
+        return _ann_assigns(fields)
 
     def _build_bases(self, class_name: str, fields: dict[str, str]) -> list[ast.expr]:
         return []
@@ -217,4 +224,4 @@ class AttrsBuilder(DataStructureBuilder):
     def _build_decorators(
         self, class_name: str, fields: dict[str, str]
     ) -> list[ast.expr]:
-        return [ast.Name(id="define", ctx=ast.Load())]
+        return self._DECORATOR_NODES
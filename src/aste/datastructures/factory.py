@@ -8,6 +8,16 @@ from aste.datastructures.builders import PydanticBuilder
 from aste.datastructures.builders import TypedDictBuilder
 
 
+# Builders are stateless, so a single shared instance per type is enough.
+# ``get_builder`` dispatches over these with a ``match`` statement, which
+# compiles the five string literals into a jump table.
+_TYPED_DICT = TypedDictBuilder()
+_DATACLASS = DataclassBuilder()
+_PYDANTIC = PydanticBuilder()
+_NAMEDTUPLE = NamedTupleBuilder()
+_ATTRS = AttrsBuilder()
+
+
 class DataStructureFactory:
     """
     Factory to obtain appropriate DataStructureBuilder by type name.
@@ -51,15 +61,17 @@ class DataStructureFactory:
         >>> "BaseModel" in code
         True
         """
-        mapping: dict[str, DataStructureBuilder] = {
-            "typed_dict": TypedDictBuilder(),
-            "dataclass": DataclassBuilder(),
-            "pydantic": PydanticBuilder(),
-            "namedtuple": NamedTupleBuilder(),
-            "attrs": AttrsBuilder(),
-        }
-        try:
-            return mapping[builder_type]
-        except KeyError as exc:
-            message = f"Unknown builder type: {builder_type}"
-            raise ValueError(message) from exc
+        match builder_type:
+            case "typed_dict":
+                return _TYPED_DICT
+            case "dataclass":
+                return _DATACLASS
+            case "pydantic":
+                return _PYDANTIC
+            case "namedtuple":
+                return _NAMEDTUPLE
+            case "attrs":
+                return _ATTRS
+            case _:
+                message = f"Unknown builder type: {builder_type}"
+                raise ValueError(message)
@@ -1,12 +1,18 @@
 """Utility functions for AST experiments."""
 
+from aste.utils.json_schema import infer_fields_from_file
 from aste.utils.json_schema import infer_fields_from_json
 from aste.utils.json_schema import load_json_from_file
 from aste.utils.json_schema import load_json_from_url
+from aste.utils.json_schema import load_json_from_urls
+from aste.utils.json_schema import make_inferrer
 
 
 __all__ = [
+    "infer_fields_from_file",
     "infer_fields_from_json",
     "load_json_from_file",
     "load_json_from_url",
+    "load_json_from_urls",
+    "make_inferrer",
 ]
@@ -1,19 +1,112 @@
 """JSON schema inference utilities."""
 
+import asyncio
+from collections import defaultdict
+from collections.abc import Callable
+from collections.abc import Iterable
+from functools import lru_cache
+from http.client import HTTPConnection
+from http.client import HTTPException
+from http.client import HTTPSConnection
 import json
+import mmap
 from pathlib import Path
+import sys
+import threading
+from typing import IO
 from typing import Any
-from urllib.request import urlopen
+from typing import cast
+from urllib.error import HTTPError
+from urllib.error import URLError
+from urllib.parse import urljoin
+from urllib.parse import urlsplit
 
 
-def load_json_from_file(file_path: str | Path) -> dict[str, Any]:
+try:
+    # Optional native parser: orjson decodes UTF-8 bytes directly and is
+    # typically several times faster than the stdlib for these payloads.
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads  # type: ignore[assignment]
+
+# orjson reads buffer-protocol objects (e.g. memoryview) directly; the
+# stdlib parser only takes str/bytes/bytearray.
+_PARSER_ACCEPTS_BUFFERS = _loads.__module__ == "orjson"
+
+try:
+    # Optional streaming parser: lets schema inference walk huge files
+    # without materializing the whole document.
+    import ijson  # type: ignore[import-untyped]
+except ImportError:
+    ijson = None
+
+
+def _check_structural_prefix(payload: bytes) -> bytes:
     """
-    Load JSON data from a local file.
+    Reject payloads that cannot be a JSON object or array.
+
+    A failed full parse walks the whole input before raising; checking
+    that the first non-whitespace byte opens a container is a one-pass
+    prefix scan that rejects obviously malformed input immediately.
 
     Parameters
     ----------
-    file_path : str | Path
-        Path to the JSON file
+    payload : bytes
+        Raw JSON document
+
+    Returns
+    -------
+    bytes
+        The payload, unchanged, when structurally plausible
+
+    Raises
+    ------
+    json.JSONDecodeError
+        If the payload does not start with ``{`` or ``[``
+    """
+    prefix = payload[:64]
+    stripped = prefix.lstrip()
+    if not stripped or stripped[0] not in b"{[":
+        # Decode only the prefix for the exception doc: decoding a large
+        # malformed payload would defeat the point of the early reject.
+        message = "Expecting a JSON object or array"
+        raise json.JSONDecodeError(message, prefix.decode("utf-8", errors="replace"), 0)
+    return payload
+
+
+# Files above this size are parsed straight from a read-only memory map,
+# sharing the kernel page cache instead of copying into a bytes object.
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _load_mapped(path: Path) -> dict[str, Any]:
+    """Parse a large JSON file through a read-only memory map."""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        try:
+            _check_structural_prefix(mapped[:64])
+            if _PARSER_ACCEPTS_BUFFERS:
+                # orjson reads the mapped pages zero-copy through the
+                # memoryview; the stdlib parser needs real bytes.
+                return _loads(view)  # pyright: ignore[reportArgumentType]
+            return _loads(bytes(view))
+        finally:
+            view.release()
+            mapped.close()
+
+
+def load_json_from_file(source: str | Path | IO[bytes]) -> dict[str, Any]:
+    """
+    Load JSON data from a local file or an open binary stream.
+
+    Accepting a readable object (e.g. ``io.BytesIO``) lets callers skip
+    the filesystem entirely when the payload is already in memory.
+
+    Parameters
+    ----------
+    source : str | Path | IO[bytes]
+        Path to the JSON file, or a readable binary stream
 
     Returns
     -------
@@ -25,7 +118,7 @@ def load_json_from_file(file_path: str | Path) -> dict[str, Any]:
     FileNotFoundError
         If the file does not exist
     json.JSONDecodeError
-        If the file contains invalid JSON
+        If the input contains invalid JSON
 
     Examples
     --------
@@ -33,15 +126,61 @@ def load_json_from_file(file_path: str | Path) -> dict[str, Any]:
     >>> isinstance(data, dict)
     True
     """
-    path = Path(file_path)
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        if path.stat().st_size > _MMAP_THRESHOLD:
+            return _load_mapped(path)
+        # Reading bytes skips the text-layer decode; both parsers
+        # accept them.
+        return _loads(_check_structural_prefix(path.read_bytes()))
+    return _loads(_check_structural_prefix(source.read()))
+
+
+# Keep-alive connections cached per (scheme, host): fetching many JSON
+# endpoints from the same host reuses one socket instead of paying the
+# TCP/TLS handshake on every request. The cache is thread-local because
+# http.client connections are not thread-safe; concurrent callers each
+# get their own socket instead of interleaving requests on one.
+class _ConnectionCache(threading.local):
+    """Per-thread keep-alive connections, keyed by (scheme, host)."""
+
+    def __init__(self) -> None:
+        self.by_host: dict[tuple[str, str], HTTPConnection] = {}
+
+
+_CONNECTIONS = _ConnectionCache()
+
+
+def _get_connection(scheme: str, netloc: str) -> HTTPConnection:
+    """Return (or open) this thread's connection for a scheme/host pair."""
+    key = (scheme, netloc)
+    connection = _CONNECTIONS.by_host.get(key)
+    if connection is None:
+        connection_cls = HTTPSConnection if scheme == "https" else HTTPConnection
+        connection = connection_cls(netloc, timeout=10)
+        _CONNECTIONS.by_host[key] = connection
+    return connection
+
+
+def _drop_connection(scheme: str, netloc: str) -> None:
+    """Close and forget this thread's connection for a scheme/host pair."""
+    connection = _CONNECTIONS.by_host.pop((scheme, netloc), None)
+    if connection is not None:
+        connection.close()
+
+
+# Redirect chains longer than this raise instead of looping forever.
+_MAX_REDIRECTS = 5
 
 
 def load_json_from_url(url: str) -> dict[str, Any]:
     """
     Load JSON data from a URL.
 
+    Connections are kept alive and reused per host, so walking a
+    catalogue of endpoints on the same host pays the TCP/TLS handshake
+    only once. Redirects are followed up to ``_MAX_REDIRECTS`` hops.
+
     Parameters
     ----------
     url : str
@@ -54,6 +193,8 @@ def load_json_from_url(url: str) -> dict[str, Any]:
 
     Raises
     ------
+    urllib.error.HTTPError
+        If the server answers with a non-2xx status
     urllib.error.URLError
         If the URL cannot be reached
     json.JSONDecodeError
@@ -65,12 +206,132 @@ def load_json_from_url(url: str) -> dict[str, Any]:
     >>> isinstance(data, dict)
     True
     """
-    with urlopen(url) as response:
-        content = response.read().decode("utf-8")
-        return json.loads(content)
+    redirects = 0
+    retried = False
+    while True:
+        parts = urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        connection = _get_connection(parts.scheme, parts.netloc)
+        try:
+            connection.request("GET", target)
+            response = connection.getresponse()
+            # Drain the body even on error statuses so the keep-alive
+            # socket stays reusable for the next request.
+            body = response.read()
+        except (HTTPException, OSError) as exc:
+            # The kept-alive socket may have gone stale since the last
+            # request; rebuild it and retry once before giving up.
+            _drop_connection(parts.scheme, parts.netloc)
+            if retried:
+                raise URLError(exc) from exc
+            retried = True
+            continue
+        status = response.status
+        if 200 <= status < 300:
+            return _loads(body)
+        if 300 <= status < 400:
+            location = response.getheader("Location")
+            if location is None or redirects >= _MAX_REDIRECTS:
+                raise HTTPError(url, status, response.reason, response.headers, None)
+            url = urljoin(url, location)
+            redirects += 1
+            retried = False
+            continue
+        # 4xx/5xx bodies are often JSON error envelopes; surface them as
+        # an HTTPError instead of inferring a schema from the error.
+        raise HTTPError(url, status, response.reason, response.headers, None)
+
+
+# Exact-type dispatch table for the hot inference path: a single dict
+# lookup on type(value) replaces the isinstance ladder (and, unlike
+# isinstance, cannot confuse bool with int).
+_TYPE_TO_NAME: dict[type, str] = {
+    type(None): sys.intern("None"),
+    bool: sys.intern("bool"),
+    int: sys.intern("int"),
+    float: sys.intern("float"),
+    str: sys.intern("str"),
+}
+
+# Interned annotations for empty containers; composite names built at
+# inference time are interned on the fly so repeated fields share one
+# string object and downstream comparisons become pointer checks.
+_LIST_ANY = sys.intern("list[Any]")
+_DICT_ANY = sys.intern("dict[str, Any]")
+
+# Upper bound on how many list elements are probed when inferring the
+# element type: enough to catch mixed arrays, cheap for huge ones.
+_LIST_SAMPLE_SIZE = 32
+
+
+async def load_json_from_urls(urls: list[str]) -> list[dict[str, Any]]:
+    """
+    Load JSON data from several URLs concurrently.
+
+    URLs are grouped by host: each host is fetched sequentially over its
+    keep-alive connection (worker thread per host), while different
+    hosts are fetched in parallel, so total latency approaches that of
+    the slowest host instead of the sum of all round trips.
+
+    Parameters
+    ----------
+    urls : list[str]
+        URLs to fetch JSON from
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        Parsed JSON documents, in the same order as ``urls``
+
+    Raises
+    ------
+    urllib.error.URLError
+        If any URL cannot be reached
+    json.JSONDecodeError
+        If any response contains invalid JSON
+
+    Examples
+    --------
+    >>> docs = asyncio.run(load_json_from_urls(["https://api.example.com/user"]))
+    >>> isinstance(docs[0], dict)
+    True
+    """
+    by_host: defaultdict[tuple[str, str], list[int]] = defaultdict(list)
+    for index, url in enumerate(urls):
+        parts = urlsplit(url)
+        by_host[(parts.scheme, parts.netloc)].append(index)
+
+    results: list[dict[str, Any]] = [{} for _ in urls]
+
+    def fetch_host(indexes: list[int]) -> None:
+        for index in indexes:
+            results[index] = load_json_from_url(urls[index])
+
+    await asyncio.gather(
+        *(asyncio.to_thread(fetch_host, indexes) for indexes in by_host.values())
+    )
+    return results
+
+
+@lru_cache(maxsize=256)
+def _format_container(outer: str, inner: str) -> str:
+    """Build and memoize a composite annotation like ``list[int]``."""
+    return sys.intern(f"{outer}[{inner}]")
+
 
+class _Collate:
+    """Stack marker: combine the last ``count`` results into a container."""
 
-def infer_python_type(value: Any) -> str:  # noqa: C901
+    __slots__ = ("count", "kind")
+
+    def __init__(self, kind: str, count: int) -> None:
+        self.kind = kind
+        self.count = count
+
+
+def infer_python_type(value: Any, strict: bool = False) -> str:  # noqa: C901
     """
     Infer Python type annotation from a value.
 
@@ -78,6 +339,10 @@ def infer_python_type(value: Any) -> str:  # noqa: C901
     ----------
     value : Any
         Value to infer type from
+    strict : bool, optional
+        When True, probe a bounded sample of each list so mixed element
+        types surface as a union. By default only the first element is
+        inspected, which is O(1) and exact for type-stable arrays.
 
     Returns
     -------
@@ -94,38 +359,104 @@ def infer_python_type(value: Any) -> str:  # noqa: C901
     'list[int]'
     >>> infer_python_type({"a": 1})
     'dict[str, int]'
+    >>> infer_python_type([1, "a"], strict=True)
+    'list[int | str]'
     """
-    if value is None:
-        return "None"
-    elif isinstance(value, bool):
-        return "bool"
-    elif isinstance(value, int):
-        return "int"
-    elif isinstance(value, float):
-        return "float"
-    elif isinstance(value, str):
-        return "str"
-    elif isinstance(value, list):
-        if not value:
-            return "list[Any]"
-        # Infer type from first element
-        first_type = infer_python_type(value[0])
-        return f"list[{first_type}]"
-    elif isinstance(value, dict):
-        if not value:
-            return "dict[str, Any]"
-        # Infer from first key-value pair - use type: ignore for dynamic dict
-        items: list[tuple[Any, Any]] = list(value.items())  # type: ignore[misc]
-        if items:
-            first_key: Any
-            first_value: Any
-            first_key, first_value = items[0]
-            key_type = infer_python_type(first_key)
-            value_type = infer_python_type(first_value)
-            return f"dict[{key_type}, {value_type}]"
-        return "dict[str, Any]"
-    else:
-        return "Any"
+    # Explicit post-order walk instead of recursion: no per-level Python
+    # call overhead and no recursion limit on pathologically deep JSON.
+    # Containers push their children plus a _Collate marker; popping the
+    # marker folds the children's annotations back into one string.
+    stack: list[Any] = [value]
+    results: list[str] = []
+    while stack:
+        item = stack.pop()
+        if type(item) is _Collate:
+            if item.kind == "list":
+                # Probe a bounded sample so mixed arrays surface as a
+                # union instead of silently taking one element's type.
+                types_seen = frozenset(results[-item.count :])
+                del results[-item.count :]
+                if len(types_seen) == 1:
+                    inner = next(iter(types_seen))
+                else:
+                    inner = " | ".join(sorted(types_seen))
+                results.append(_format_container("list", inner))
+            else:
+                item_type = results.pop()
+                key_type = results.pop()
+                results.append(_format_container("dict", f"{key_type}, {item_type}"))
+            continue
+        item_cls = cast("type[Any]", type(item))
+        name = _TYPE_TO_NAME.get(item_cls)
+        if name is not None:
+            results.append(name)
+            continue
+        if item_cls is list:
+            if not item:
+                results.append(_LIST_ANY)
+                continue
+            # Fast path assumes type-stable arrays and probes only the
+            # first element; strict mode scans a bounded sample so mixed
+            # types surface as a union.
+            if strict:
+                sample = item[:_LIST_SAMPLE_SIZE]
+                # Bulk scan: set(map(type, ...)) iterates at C speed,
+                # so all-scalar samples fold here in one step instead
+                # of pushing every element through the walker.
+                sample_classes = set(map(type, sample))
+                if all(cls in _TYPE_TO_NAME for cls in sample_classes):
+                    names = sorted(_TYPE_TO_NAME[cls] for cls in sample_classes)
+                    inner = names[0] if len(names) == 1 else " | ".join(names)
+                    results.append(_format_container("list", inner))
+                    continue
+            else:
+                sample = item[:1]
+            stack.append(_Collate("list", len(sample)))
+            stack.extend(sample)
+            continue
+        if item_cls is dict:
+            if not item:
+                results.append(_DICT_ANY)
+                continue
+            # Infer from the first key-value pair; the key is pushed
+            # last so its annotation lands on the results stack first.
+            first_key, first_value = next(iter(item.items()))
+            stack.append(_Collate("dict", 2))
+            stack.append(first_value)
+            stack.append(first_key)
+            continue
+        # Subclasses miss the exact-type table; fall back to isinstance
+        # so they still resolve (bool before int, as bools are ints).
+        for base, base_name in _TYPE_TO_NAME.items():
+            if isinstance(item, base):
+                results.append(base_name)
+                break
+        else:
+            if isinstance(item, list):
+                stack.append(list(cast("list[Any]", item)))
+            elif isinstance(item, dict):
+                stack.append(dict(cast("dict[Any, Any]", item)))
+            else:
+                results.append("Any")
+    return results[0]
+
+
+def _constant_handler(name: str) -> Callable[[Any], str]:
+    """Return a handler that maps any value to a fixed type name."""
+
+    def handler(_value: Any) -> str:
+        return name
+
+    return handler
+
+
+# Top-level dispatch for infer_fields_from_json: scalar fields resolve
+# through a constant handler without ever entering the tree walker, so
+# the common case is one dict lookup plus one trivial call per field.
+# Containers and unknown types fall back to infer_python_type.
+_DISPATCH: dict[type, Callable[[Any], str]] = {
+    cls: _constant_handler(name) for cls, name in _TYPE_TO_NAME.items()
+}
 
 
 def infer_fields_from_json(data: dict[str, Any]) -> dict[str, str]:
@@ -153,7 +484,117 @@ def infer_fields_from_json(data: dict[str, Any]) -> dict[str, str]:
     >>> fields["is_active"]
     'bool'
     """
-    fields: dict[str, str] = {}
-    for key, value in data.items():
-        fields[key] = infer_python_type(value)
-    return fields
+    # Local aliases + comprehension: LOAD_FAST instead of LOAD_GLOBAL
+    # per field, and the result dict is allocated with a size hint.
+    dispatch_get = _DISPATCH.get
+    _infer = infer_python_type
+    items = cast("Iterable[tuple[str, object]]", data.items())
+    return {key: dispatch_get(type(value), _infer)(value) for key, value in items}
+
+
+# Specialized inferrers compiled per observed schema shape, keyed by the
+# sample's (key, value-class) pairs.
+_INFERRER_CACHE: dict[
+    tuple[tuple[str, type], ...], Callable[[dict[str, Any]], dict[str, str]]
+] = {}
+
+
+def make_inferrer(
+    sample: dict[str, Any],
+) -> Callable[[dict[str, Any]], dict[str, str]]:
+    """
+    Compile an inferrer specialized to one observed schema shape.
+
+    Generates (and caches) a straight-line function for the sample's
+    keys: each field is resolved with an inlined dispatch call, with no
+    loop over ``items()``. Documents whose key set differs from the
+    sample fall back to ``infer_fields_from_json``, so the specialized
+    function is always safe to call.
+
+    Parameters
+    ----------
+    sample : dict[str, Any]
+        Representative document for the shape to specialize
+
+    Returns
+    -------
+    Callable[[dict[str, Any]], dict[str, str]]
+        Inferrer producing the same result as ``infer_fields_from_json``
+
+    Examples
+    --------
+    >>> inferrer = make_inferrer({"user_id": 1, "username": "ada"})
+    >>> inferrer({"user_id": 7, "username": "lovelace"})
+    {'user_id': 'int', 'username': 'str'}
+    """
+    sample_items = cast("Iterable[tuple[str, object]]", sample.items())
+    cache_key = tuple((key, type(value)) for key, value in sample_items)
+    inferrer = _INFERRER_CACHE.get(cache_key)
+    if inferrer is not None:
+        return inferrer
+
+    lines = [
+        "def _specialized(data):",
+        "    if data.keys() != _keys:",
+        "        return _fallback(data)",
+        "    return {",
+    ]
+    lines.extend(
+        f"        {key!r}: _get(type(data[{key!r}]), _infer)(data[{key!r}]),"
+        for key in sample
+    )
+    lines.append("    }")
+    namespace: dict[str, Any] = {
+        "_keys": frozenset(sample),
+        "_fallback": infer_fields_from_json,
+        "_get": _DISPATCH.get,
+        "_infer": infer_python_type,
+    }
+    exec(compile("\n".join(lines), "<aste:inferrer>", "exec"), namespace)
+    inferrer = namespace["_specialized"]
+    _INFERRER_CACHE[cache_key] = inferrer
+    return inferrer
+
+
+def infer_fields_from_file(file_path: str | Path) -> dict[str, str]:
+    """
+    Infer top-level field types straight from a JSON file.
+
+    Schema inference only needs one top-level value at a time, so when
+    ijson is installed the file is stream-parsed and the full document
+    is never materialized; without it the function falls back to
+    loading the whole tree.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        Path to the JSON file (must contain a top-level object)
+
+    Returns
+    -------
+    dict[str, str]
+        Mapping of field names to Python type annotations
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist
+    json.JSONDecodeError
+        If the file contains invalid JSON (fallback path)
+
+    Examples
+    --------
+    >>> fields = infer_fields_from_file("user.json")
+    >>> fields["user_id"]
+    'int'
+    """
+    path = Path(file_path)
+    if ijson is None:
+        return infer_fields_from_json(load_json_from_file(path))
+    dispatch_get = _DISPATCH.get
+    _infer = infer_python_type
+    with path.open("rb") as f:
+        # use_float makes ijson yield floats instead of decimal.Decimal,
+        # matching what the non-streaming parsers produce.
+        pairs: Iterable[tuple[str, object]] = ijson.kvitems(f, "", use_float=True)
+        return {key: dispatch_get(type(value), _infer)(value) for key, value in pairs}
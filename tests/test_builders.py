@@ -148,6 +148,62 @@ class TestAttrsBuilder:
         ast.parse(code)
 
 
+class TestBuildCode:
+    """Test ahead-of-time compilation of generated code."""
+
+    def test_build_code_is_executable(self) -> None:
+        """Compiled code object materializes the class on exec."""
+        builder = TypedDictBuilder()
+        namespace: dict[str, object] = {}
+        exec(builder.build_code("User", {"id": "int"}), namespace)
+        assert "User" in namespace
+
+    def test_build_code_is_cached(self) -> None:
+        """Repeat calls with identical arguments hit the cache."""
+        builder = DataclassBuilder()
+        first = builder.build_code("Point", {"x": "int", "y": "int"})
+        second = builder.build_code("Point", {"x": "int", "y": "int"})
+        assert first is second
+
+
+class TestBuildStreaming:
+    """Test the chunked and binary rendering paths."""
+
+    @pytest.mark.parametrize(
+        "builder_class",
+        [
+            TypedDictBuilder,
+            DataclassBuilder,
+            PydanticBuilder,
+            NamedTupleBuilder,
+            AttrsBuilder,
+        ],
+    )
+    def test_build_iter_matches_build(self, builder_class: type) -> None:
+        """Joined build_iter chunks equal build() plus a trailing newline."""
+        builder = builder_class()
+        fields = {"id": "int", "name": "str"}
+        chunks = "".join(builder.build_iter("User", fields))
+        assert chunks == builder.build("User", fields) + "\n"
+
+    @pytest.mark.parametrize(
+        "builder_class",
+        [
+            TypedDictBuilder,
+            DataclassBuilder,
+            PydanticBuilder,
+            NamedTupleBuilder,
+            AttrsBuilder,
+        ],
+    )
+    def test_build_bytes_matches_build_iter(self, builder_class: type) -> None:
+        """build_bytes equals the UTF-8 encoding of the streamed output."""
+        builder = builder_class()
+        fields = {"id": "int", "name": "str"}
+        streamed = "".join(builder.build_iter("User", fields))
+        assert builder.build_bytes("User", fields) == streamed.encode("utf-8")
+
+
 class TestBuilderFieldTypes:
     """Test builders handle various field types correctly."""
 
@@ -1,14 +1,64 @@
 """Tests for JSON schema inference utilities."""
 
+import asyncio
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from io import BytesIO
 import json
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+import threading
+from typing import ClassVar
+from urllib.error import HTTPError
 
 import pytest
 
+from aste.utils.json_schema import infer_fields_from_file
 from aste.utils.json_schema import infer_fields_from_json
 from aste.utils.json_schema import infer_python_type
 from aste.utils.json_schema import load_json_from_file
+from aste.utils.json_schema import load_json_from_url
+from aste.utils.json_schema import load_json_from_urls
+from aste.utils.json_schema import make_inferrer
+
+
+class _JsonHandler(BaseHTTPRequestHandler):
+    """Serve a few fixed JSON routes over keep-alive HTTP/1.1."""
+
+    protocol_version = "HTTP/1.1"
+
+    _ROUTES: ClassVar[dict[str, tuple[int, bytes]]] = {
+        "/user": (200, b'{"user_id": 1}'),
+        "/profile": (200, b'{"username": "ada"}'),
+        "/missing": (404, b'{"error": "not found"}'),
+    }
+
+    def do_GET(self) -> None:
+        if self.path == "/moved":
+            self.send_response(302)
+            self.send_header("Location", "/user")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        status, body = self._ROUTES.get(self.path, (404, b"{}"))
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Keep test output quiet."""
+
+
+@pytest.fixture
+def json_server() -> Iterator[str]:
+    """Run a local JSON server and yield its base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _JsonHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
 
 
 class TestInferPythonType:
@@ -64,6 +114,16 @@ class TestInferPythonType:
         """Infer dict[str, str] type."""
         assert infer_python_type({"name": "Alice", "city": "NYC"}) == "dict[str, str]"
 
+    def test_infer_mixed_list_strict(self) -> None:
+        """Infer a union element type from mixed lists in strict mode."""
+        assert infer_python_type([1, "a", None], strict=True) == (
+            "list[None | int | str]"
+        )
+
+    def test_infer_mixed_list_fast_path(self) -> None:
+        """Default mode probes only the first element."""
+        assert infer_python_type([1, "a", None]) == "list[int]"
+
     def test_infer_nested_list(self) -> None:
         """Infer nested list type."""
         assert infer_python_type([[1, 2], [3, 4]]) == "list[list[int]]"
@@ -77,16 +137,15 @@ class TestLoadJsonFromFile:
     """Test loading JSON from local files."""
 
     def test_load_valid_json(self) -> None:
-        """Load valid JSON from file."""
-        with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump({"name": "Alice", "age": 30}, f)
-            temp_path = Path(f.name)
+        """Load valid JSON from an in-memory stream."""
+        data = load_json_from_file(BytesIO(b'{"name": "Alice", "age": 30}'))
+        assert data == {"name": "Alice", "age": 30}
 
-        try:
-            data = load_json_from_file(temp_path)
-            assert data == {"name": "Alice", "age": 30}
-        finally:
-            temp_path.unlink()
+    def test_load_valid_json_from_disk(self, tmp_path: Path) -> None:
+        """Load valid JSON from an actual file on disk."""
+        json_file = tmp_path / "user.json"
+        json_file.write_text(json.dumps({"name": "Alice", "age": 30}))
+        assert load_json_from_file(json_file) == {"name": "Alice", "age": 30}
 
     def test_load_nonexistent_file(self) -> None:
         """Raise FileNotFoundError for nonexistent file."""
@@ -95,15 +154,45 @@ class TestLoadJsonFromFile:
 
     def test_load_invalid_json(self) -> None:
         """Raise JSONDecodeError for invalid JSON."""
-        with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("not valid json {")
-            temp_path = Path(f.name)
+        with pytest.raises(json.JSONDecodeError):
+            load_json_from_file(BytesIO(b"not valid json {"))
+
+
+class TestLoadJsonFromUrl:
+    """Test loading JSON over HTTP."""
+
+    def test_load_json(self, json_server: str) -> None:
+        """Load a JSON document from a 2xx response."""
+        assert load_json_from_url(f"{json_server}/user") == {"user_id": 1}
+
+    def test_error_status_raises(self, json_server: str) -> None:
+        """Raise HTTPError for non-2xx responses instead of parsing them."""
+        with pytest.raises(HTTPError) as excinfo:
+            load_json_from_url(f"{json_server}/missing")
+        assert excinfo.value.code == 404
+
+    def test_redirect_is_followed(self, json_server: str) -> None:
+        """Follow a redirect to the target document."""
+        assert load_json_from_url(f"{json_server}/moved") == {"user_id": 1}
+
+
+class TestLoadJsonFromUrls:
+    """Test concurrent loading of several URLs."""
 
-        try:
-            with pytest.raises(json.JSONDecodeError):
-                load_json_from_file(temp_path)
-        finally:
-            temp_path.unlink()
+    def test_results_keep_url_order(self, json_server: str) -> None:
+        """Documents come back in the order the URLs were given."""
+        urls = [f"{json_server}/profile", f"{json_server}/user"]
+        documents = asyncio.run(load_json_from_urls(urls))
+        assert documents == [{"username": "ada"}, {"user_id": 1}]
+
+    def test_merged_documents(self, json_server: str) -> None:
+        """Documents from one host merge into a combined field set."""
+        urls = [f"{json_server}/user", f"{json_server}/profile"]
+        documents = asyncio.run(load_json_from_urls(urls))
+        merged: dict[str, object] = {}
+        for document in documents:
+            merged.update(document)
+        assert merged == {"user_id": 1, "username": "ada"}
 
 
 class TestInferFieldsFromJson:
@@ -143,3 +232,50 @@ class TestInferFieldsFromJson:
         """Infer fields from empty JSON."""
         fields = infer_fields_from_json({})
         assert fields == {}
+
+
+class TestMakeInferrer:
+    """Test schema-shape-specialized inferrers."""
+
+    def test_matches_generic_inference(self) -> None:
+        """Specialized inferrer agrees with infer_fields_from_json."""
+        sample = {"user_id": 1, "username": "ada", "score": 9.5}
+        inferrer = make_inferrer(sample)
+        document = {"user_id": 7, "username": "lovelace", "score": 1.2}
+        assert inferrer(document) == infer_fields_from_json(document)
+
+    def test_same_shape_reuses_compiled_inferrer(self) -> None:
+        """Samples with identical shapes share one compiled function."""
+        first = make_inferrer({"user_id": 1, "username": "ada"})
+        second = make_inferrer({"user_id": 2, "username": "grace"})
+        assert first is second
+
+    def test_shape_mismatch_falls_back(self) -> None:
+        """Documents with different keys fall back to generic inference."""
+        inferrer = make_inferrer({"user_id": 1})
+        assert inferrer({"username": "ada"}) == {"username": "str"}
+
+
+class TestInferFieldsFromFile:
+    """Test streaming field inference from JSON files."""
+
+    def test_infer_fields_from_file(self, tmp_path: Path) -> None:
+        """Infer top-level fields without loading the full document."""
+        json_file = tmp_path / "user.json"
+        json_file.write_text(
+            json.dumps(
+                {"user_id": 123, "username": "alice", "rating": 4.5, "scores": [1, 2]}
+            )
+        )
+        fields = infer_fields_from_file(json_file)
+        assert fields == {
+            "user_id": "int",
+            "username": "str",
+            "rating": "float",
+            "scores": "list[int]",
+        }
+
+    def test_infer_fields_from_missing_file(self) -> None:
+        """Raise FileNotFoundError for nonexistent file."""
+        with pytest.raises(FileNotFoundError):
+            infer_fields_from_file("nonexistent.json")